@@ -1,16 +1,21 @@
 """Main FastAPI application for Dragonseeker game."""
 
+import logging
+import os
+import queue
 import secrets
 from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
 
 from core.game_manager import game_manager
-from middleware import RateLimitMiddleware, SecurityHeadersMiddleware
+from middleware import ProfilerMiddleware, RateLimitMiddleware, SecurityHeadersMiddleware
 from routes import game, gameplay, lobby, websocket
+from routes.templating import templates
 
 
 @asynccontextmanager
@@ -19,6 +24,18 @@ async def lifespan(app: FastAPI):
     # Startup
     print("🐉 Dragonseeker game server starting...")
 
+    # Route application logs through a queue so handler I/O runs on a background
+    # thread instead of blocking the event loop
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(levelname)s: %(name)s: %(message)s"))
+    log_listener = QueueListener(log_queue, stream_handler)
+    root_logger = logging.getLogger()
+    root_logger.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+    root_logger.addHandler(queue_handler)
+    log_listener.start()
+
     # Generate secret key for token signing (in memory, rotates on restart)
     app.state.secret_key = secrets.token_hex(32)
     print("🔐 Generated secret key for token signing")
@@ -27,6 +44,8 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     print("👋 Shutting down game server...")
+    log_listener.stop()
+    root_logger.removeHandler(queue_handler)
 
 
 # Initialize FastAPI app
@@ -35,6 +54,7 @@ app = FastAPI(
     description="A social deduction party game",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -59,12 +79,14 @@ app.add_middleware(SecurityHeadersMiddleware)  # type: ignore[arg-type]
 # Note: type ignore needed due to Starlette's middleware type stub limitations
 app.add_middleware(RateLimitMiddleware)  # type: ignore[arg-type]
 
+# Add request profiling middleware (opt-in: ENABLE_PROFILING=1, then append ?__profile=1)
+# Note: type ignore needed due to Starlette's middleware type stub limitations
+if os.getenv("ENABLE_PROFILING") == "1":
+    app.add_middleware(ProfilerMiddleware)  # type: ignore[arg-type]
+
 # Mount static files
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
-# Configure templates
-templates = Jinja2Templates(directory="templates")
-
 # Include routers
 app.include_router(game.router, tags=["game"])
 app.include_router(lobby.router, tags=["lobby"])
@@ -1,12 +1,61 @@
 """Authentication and token management for player sessions."""
 
 import base64
-import hashlib
 import hmac
 import time
+from functools import lru_cache
 from typing import Any
 
-from fastapi import HTTPException, Request
+from fastapi import Depends, HTTPException, Request
+
+from .constants import TOKEN_CACHE_MAX_SIZE, TOKEN_CACHE_TTL_SECONDS
+
+# Verified-token cache: (token, secret_key) -> (game_id, player_id, expiry, cached_until)
+#
+# Invariant: only tokens whose HMAC signature has been checked with
+# hmac.compare_digest are ever inserted, and lookups use the full raw token.
+# A cache hit is therefore an exact match of an already-authenticated string,
+# so the hit path needs no constant-time comparison and a forged token can
+# never be served from (or planted in) the cache.
+#
+# The dict is not locked: it must only be touched from the event loop. Removals
+# still use pop(..., None) so a racing caller can never turn into a KeyError.
+_verified_tokens: dict[tuple[str, str], tuple[str, str, int, float]] = {}
+
+
+@lru_cache(maxsize=8)
+def _hmac_template(secret_key: str) -> hmac.HMAC:
+    """Build a keyed HMAC-SHA256 object to copy for each signature.
+
+    The key is encoded and the inner/outer pad states are derived once per
+    secret; callers must ``copy()`` the template rather than update it.
+
+    Args:
+        secret_key: Secret key for signing
+
+    Returns:
+        HMAC object with no message data fed in
+    """
+    return hmac.new(secret_key.encode(), digestmod="sha256")
+
+
+def _sign(payload: str, secret_key: str) -> bytes:
+    """Compute the HMAC-SHA256 signature of a token payload.
+
+    Copies a pre-keyed template so the key schedule is not repeated per call.
+    The hashing itself runs in OpenSSL (SHA-NI/ARMv8 SHA2 accelerated where the
+    CPU supports it).
+
+    Args:
+        payload: Token payload to sign
+        secret_key: Secret key for signing
+
+    Returns:
+        Raw 32-byte signature
+    """
+    mac = _hmac_template(secret_key).copy()
+    mac.update(payload.encode())
+    return mac.digest()
 
 
 def generate_player_token(game_id: str, player_id: str, secret_key: str) -> str:
@@ -25,14 +74,10 @@ def generate_player_token(game_id: str, player_id: str, secret_key: str) -> str:
     payload = f"{game_id}:{player_id}:{expiry}"
 
     # Generate HMAC signature
-    signature = hmac.new(
-        secret_key.encode(),
-        payload.encode(),
-        hashlib.sha256,
-    ).digest()
+    signature = _sign(payload, secret_key)
 
     # Encode signature as base64
-    signature_b64 = base64.urlsafe_b64encode(signature).decode().rstrip("=")
+    signature_b64 = base64.urlsafe_b64encode(signature).rstrip(b"=").decode()
 
     # Return token as payload.signature
     return f"{payload}.{signature_b64}"
@@ -51,41 +96,49 @@ def verify_player_token(token: str | None, secret_key: str) -> dict[str, Any] |
     if not token:
         return None
 
+    # Fast path: token was already verified recently
+    cache_key = (token, secret_key)
+    cached = _verified_tokens.get(cache_key)
+    if cached is not None:
+        game_id, player_id, expiry, cached_until = cached
+        if time.time() <= cached_until:
+            return {
+                "game_id": game_id,
+                "player_id": player_id,
+                "expiry": expiry,
+            }
+        _verified_tokens.pop(cache_key, None)
+
     try:
-        # Split token into payload and signature
-        parts = token.split(".")
-        if len(parts) != 2:
+        # Split token into payload and signature ("game_id:player_id:expiry.signature")
+        payload, dot, signature_b64 = token.partition(".")
+        if not dot or "." in signature_b64:
             return None
 
-        payload, signature_b64 = parts
-
-        # Parse payload
-        payload_parts = payload.split(":")
-        if len(payload_parts) != 3:
+        # Parse payload (extra separators end up in expiry_str and fail isdigit)
+        game_id, _, rest = payload.partition(":")
+        player_id, _, expiry_str = rest.partition(":")
+        if not game_id or not player_id or not expiry_str.isdigit():
             return None
 
-        game_id, player_id, expiry_str = payload_parts
-
         # Check expiry
         expiry = int(expiry_str)
         if time.time() > expiry:
             return None
 
         # Verify signature
-        expected_signature = hmac.new(
-            secret_key.encode(),
-            payload.encode(),
-            hashlib.sha256,
-        ).digest()
-
-        # Decode provided signature (add padding if needed)
-        padding = "=" * (4 - len(signature_b64) % 4)
+        expected_signature = _sign(payload, secret_key)
+
+        # Decode provided signature (restore the stripped padding, 0-2 chars)
+        padding = "=" * (-len(signature_b64) & 3)
         provided_signature = base64.urlsafe_b64decode(signature_b64 + padding)
 
         # Constant-time comparison to prevent timing attacks
         if not hmac.compare_digest(expected_signature, provided_signature):
             return None
 
+        _cache_verified_token(cache_key, game_id, player_id, expiry)
+
         return {
             "game_id": game_id,
             "player_id": player_id,
@@ -96,6 +149,55 @@ def verify_player_token(token: str | None, secret_key: str) -> dict[str, Any] |
         return None
 
 
+def _cache_verified_token(
+    cache_key: tuple[str, str], game_id: str, player_id: str, expiry: int
+) -> None:
+    """Remember a verified token so repeat requests skip HMAC verification.
+
+    Entries live for at most TOKEN_CACHE_TTL_SECONDS and never past the token's
+    own expiry. When the cache is full the oldest entry is evicted.
+
+    Args:
+        cache_key: (token, secret_key) pair that was verified
+        game_id: Game ID from the token payload
+        player_id: Player ID from the token payload
+        expiry: Token expiry timestamp
+    """
+    if len(_verified_tokens) >= TOKEN_CACHE_MAX_SIZE:
+        oldest_key = next(iter(_verified_tokens))
+        _verified_tokens.pop(oldest_key, None)
+
+    cached_until = min(time.time() + TOKEN_CACHE_TTL_SECONDS, expiry)
+    _verified_tokens[cache_key] = (game_id, player_id, expiry, cached_until)
+
+
+def invalidate_game_tokens(game_id: str) -> None:
+    """Drop all cached verified tokens belonging to a game.
+
+    Args:
+        game_id: The game session ID
+    """
+    stale_keys = [key for key, entry in list(_verified_tokens.items()) if entry[0] == game_id]
+    for key in stale_keys:
+        _verified_tokens.pop(key, None)
+
+
+@lru_cache(maxsize=4096)
+def player_cookie_name(player_id: str) -> str:
+    """Get the name of the cookie holding a player's token.
+
+    Names are per player so several players can share one browser. Cached so
+    repeat requests reuse the same string object for the cookie lookup.
+
+    Args:
+        player_id: The player's unique ID
+
+    Returns:
+        Cookie name for the player's token
+    """
+    return "player_token_" + player_id
+
+
 def get_secret_key() -> str:
     """Get the secret key from app state.
 
@@ -113,26 +215,50 @@ def get_secret_key() -> str:
     return app.state.secret_key
 
 
-def get_token_data(request: Request) -> dict[str, Any]:
-    """Extract and validate player token from cookie.
+async def get_player_id(request: Request) -> str:
+    """Read the required player_id query parameter.
+
+    Reads the request's already-parsed query string directly instead of going
+    through Query(...) validation, since it is a single plain string. Declared
+    async (it never awaits) so FastAPI runs it inline rather than in the
+    threadpool.
 
     Args:
-        request: FastAPI request object containing cookies and query parameters
+        request: FastAPI request object containing query parameters
 
     Returns:
-        Token data dictionary with game_id, player_id, expiry
+        The player's ID
 
     Raises:
-        HTTPException: If token is invalid or expired
+        HTTPException: If player_id is missing or empty
     """
-    # Extract player_id from query parameters
     player_id = request.query_params.get("player_id")
     if not player_id:
         raise HTTPException(status_code=400, detail="Missing player_id parameter")
+    return player_id
+
 
+async def get_token_data(
+    request: Request,
+    player_id: str = Depends(get_player_id),  # noqa: B008
+) -> dict[str, Any]:
+    """Extract and validate player token from cookie.
+
+    Pure CPU work (verified tokens are cached), so it is async to run inline
+    on the event loop instead of being dispatched to the threadpool.
+
+    Args:
+        request: FastAPI request object containing cookies
+        player_id: The player's ID from the query string (injected)
+
+    Returns:
+        Token data dictionary with game_id, player_id, expiry
+
+    Raises:
+        HTTPException: If token is invalid or expired
+    """
     # Get token from player-specific cookie
-    cookie_name = f"player_token_{player_id}"
-    player_token = request.cookies.get(cookie_name)
+    player_token = request.cookies.get(player_cookie_name(player_id))
 
     secret_key = get_secret_key()
     token_data = verify_player_token(player_token, secret_key)
@@ -8,8 +8,17 @@ MAX_PLAYERS = 12
 GAME_TTL_SECONDS = 3600  # Unfinished games are cleaned up after 1 hour
 FINISHED_GAME_TTL_SECONDS = 1800  # Finished games are cleaned up after 30 minutes
 
+# Authentication settings
+TOKEN_CACHE_MAX_SIZE = 10_000  # Maximum number of verified tokens kept in memory
+TOKEN_CACHE_TTL_SECONDS = 300  # Verified tokens are re-checked after 5 minutes
+
+# Voting timer settings
+TIMER_CACHE_MAX_SIZE = 4096  # Maximum number of rendered timer snippets kept in memory
+TIMER_RATE_LIMIT = 20  # Timer polls per second allowed per game/player pair
+
 # WebSocket settings
 WEBSOCKET_PING_INTERVAL = 30  # Ping every 30 seconds
+BROADCAST_COALESCE_SECONDS = 0.016  # Lobby updates within one frame share a broadcast
 
 # Word pairs for the game
 # Format: (villager_word, knight_word)
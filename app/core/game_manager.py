@@ -5,6 +5,7 @@ from datetime import datetime, timedelta
 
 from .constants import FINISHED_GAME_TTL_SECONDS, GAME_TTL_SECONDS
 from .game_session import GameSession, GameState
+from .player import Player
 
 
 class GameManager:
@@ -42,6 +43,24 @@ class GameManager:
         """
         return self.games.get(game_id)
 
+    def get_game_and_player(
+        self, game_id: str, player_id: str
+    ) -> tuple[GameSession | None, Player | None]:
+        """Retrieve a game session and one of its players in a single call.
+
+        Args:
+            game_id: The game's unique identifier
+            player_id: The player's unique identifier
+
+        Returns:
+            Tuple of (game, player). game is None if the game doesn't exist;
+            player is None if the game doesn't exist or the player isn't in it.
+        """
+        game = self.games.get(game_id)
+        if game is None:
+            return None, None
+        return game, game.players.get(player_id)
+
     def remove_game(self, game_id: str) -> None:
         """Remove a game session.
 
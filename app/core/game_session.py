@@ -1,13 +1,16 @@
 """Game session management."""
 
-import json
+import asyncio
 import random
+import time
+from collections.abc import Callable
 from datetime import datetime
 from enum import Enum
 
+import orjson
 from fastapi import WebSocket
 
-from .constants import MIN_PLAYERS, WORD_PAIRS
+from .constants import BROADCAST_COALESCE_SECONDS, MIN_PLAYERS, WORD_PAIRS
 from .player import Player
 from .roles import Role, assign_roles
 
@@ -25,6 +28,30 @@ class GameState(str, Enum):
 class GameSession:
     """Manages a single game session."""
 
+    __slots__ = (
+        "game_id",
+        "players",
+        "alive_count",
+        "state",
+        "villager_word",
+        "villager_word_lower",
+        "knight_word",
+        "created_at",
+        "started_at",
+        "finished_at",
+        "votes",
+        "connections",
+        "_broadcast_task",
+        "winner",
+        "dragon_guess",
+        "eliminated_player_id",
+        "last_elimination",
+        "player_order",
+        "voting_timer_seconds",
+        "voting_started_at",
+        "_clock",
+    )
+
     def __init__(self, game_id: str):
         """Initialize a new game session.
 
@@ -33,14 +60,17 @@ class GameSession:
         """
         self.game_id: str = game_id
         self.players: dict[str, Player] = {}
+        self.alive_count: int = 0  # Alive players, kept in sync on join/leave/elimination
         self.state: GameState = GameState.LOBBY
         self.villager_word: str | None = None  # Word for villagers
+        self.villager_word_lower: str | None = None  # Lowercased once for dragon guesses
         self.knight_word: str | None = None  # Similar word for knights
         self.created_at: datetime = datetime.now()
         self.started_at: datetime | None = None
         self.finished_at: datetime | None = None  # When game finished
         self.votes: dict[str, str] = {}  # voter_id -> target_id
         self.connections: dict[str, WebSocket] = {}  # player_id -> WebSocket
+        self._broadcast_task: asyncio.Task | None = None  # Pending coalesced broadcast
         self.winner: str | None = None  # "villagers" or "dragon"
         self.dragon_guess: str | None = None
         self.eliminated_player_id: str | None = None
@@ -49,7 +79,8 @@ class GameSession:
 
         # Voting timer settings
         self.voting_timer_seconds: int | None = None  # Timer duration (30-180), None = disabled
-        self.voting_started_at: datetime | None = None  # When voting started (for time calculation)
+        self.voting_started_at: float | None = None  # _clock() reading when voting started
+        self._clock: Callable[[], float] = time.monotonic  # Replaceable in tests
 
     def add_player(self, nickname: str) -> Player:
         """Add a new player to the game.
@@ -69,6 +100,7 @@ class GameSession:
         is_host = len(self.players) == 0  # First player is host
         player = Player(nickname=nickname, is_host=is_host)
         self.players[player.id] = player
+        self.alive_count += 1
         return player
 
     def remove_player(self, player_id: str) -> None:
@@ -77,8 +109,9 @@ class GameSession:
         Args:
             player_id: ID of the player to remove
         """
-        if player_id in self.players:
-            del self.players[player_id]
+        player = self.players.pop(player_id, None)
+        if player and player.is_alive:
+            self.alive_count -= 1
 
         if player_id in self.connections:
             del self.connections[player_id]
@@ -88,6 +121,17 @@ class GameSession:
             next_player = next(iter(self.players.values()))
             next_player.is_host = True
 
+    def eliminate_player(self, player_id: str) -> None:
+        """Mark a player as dead, keeping alive_count in sync.
+
+        Args:
+            player_id: ID of the player to eliminate
+        """
+        player = self.players.get(player_id)
+        if player and player.is_alive:
+            player.is_alive = False
+            self.alive_count -= 1
+
     def can_start(self) -> bool:
         """Check if the game can be started.
 
@@ -113,18 +157,21 @@ class GameSession:
 
         self.voting_timer_seconds = seconds
 
+    def start_voting_timer(self) -> None:
+        """Record the start of the voting countdown if a timer is configured."""
+        if self.voting_timer_seconds is not None:
+            self.voting_started_at = self._clock()
+
     def get_voting_time_remaining(self) -> int | None:
         """Calculate remaining voting time in seconds.
 
         Returns:
             Seconds remaining, or None if no timer active
         """
-        if not self.voting_timer_seconds or not self.voting_started_at:
+        if not self.voting_timer_seconds or self.voting_started_at is None:
             return None
 
-        from datetime import datetime
-
-        elapsed = (datetime.now() - self.voting_started_at).total_seconds()
+        elapsed = self._clock() - self.voting_started_at
         remaining = int(self.voting_timer_seconds - elapsed)
 
         return max(0, remaining)  # Don't return negative values
@@ -148,6 +195,7 @@ class GameSession:
         # Select random word pair
         word_pair = random.choice(WORD_PAIRS)
         self.villager_word = word_pair[0]  # Main word for villagers
+        self.villager_word_lower = self.villager_word.lower()
         self.knight_word = word_pair[1]  # Similar word for knights
 
         # Shuffle and store player order for turn-based word saying
@@ -204,7 +252,7 @@ class GameSession:
         # Random tie-breaker
         eliminated_id = random.choice(tied_players)
         eliminated_player = self.players[eliminated_id]
-        eliminated_player.is_alive = False
+        self.eliminate_player(eliminated_id)
         self.eliminated_player_id = eliminated_id
 
         # Store elimination details for display
@@ -251,8 +299,6 @@ class GameSession:
         if not player:
             return {}
 
-        alive_count = sum(1 for p in self.players.values() if p.is_alive)
-
         # Determine which word to show based on role
         your_word = None
         if player.knows_word:
@@ -271,7 +317,7 @@ class GameSession:
             "is_alive": player.is_alive,
             "players": [p.to_dict() for p in self.players.values()],
             "player_count": len(self.players),
-            "alive_count": alive_count,
+            "alive_count": self.alive_count,
             "can_start": self.can_start(),
             "votes_submitted": len(self.votes),
             "has_voted": player_id in self.votes,
@@ -289,30 +335,61 @@ class GameSession:
 
         return state_data
 
+    def schedule_broadcast(self) -> None:
+        """Schedule a state broadcast, coalescing bursts of updates into one.
+
+        Calls made while a broadcast is already pending are absorbed by it, so
+        several players joining within BROADCAST_COALESCE_SECONDS produce a
+        single broadcast. Must be called from within the running event loop.
+        """
+        if self._broadcast_task is not None:
+            return
+        self._broadcast_task = asyncio.get_running_loop().create_task(self._coalesced_broadcast())
+
+    async def _coalesced_broadcast(self) -> None:
+        """Wait out the coalescing window, then broadcast the latest state."""
+        await asyncio.sleep(BROADCAST_COALESCE_SECONDS)
+        # Clear before broadcasting: state is snapshotted synchronously, so any
+        # update made while sends are in flight schedules a fresh broadcast
+        self._broadcast_task = None
+        await self.broadcast_state()
+
     async def broadcast_state(self) -> None:
-        """Broadcast current game state to all connected players."""
+        """Broadcast current game state to all connected players.
+
+        Messages are built up front from one consistent snapshot, then sent to
+        all sockets concurrently so a slow client does not delay the others.
+        """
         print(
             f"📢 Broadcasting state for game {self.game_id} to {len(self.connections)} connections"
         )
         print(f"   Game state: {self.state.value}")
 
-        disconnected = []
+        outgoing = [
+            (
+                player_id,
+                websocket,
+                orjson.dumps(
+                    {"type": "state_update", "data": self.get_state_for_player(player_id)}
+                ).decode(),
+            )
+            for player_id, websocket in self.connections.items()
+        ]
+
+        results = await asyncio.gather(
+            *(websocket.send_text(message) for _, websocket, message in outgoing),
+            return_exceptions=True,
+        )
 
-        for player_id, websocket in self.connections.items():
-            try:
-                state = self.get_state_for_player(player_id)
-                message = json.dumps({"type": "state_update", "data": state})
-                await websocket.send_text(message)
+        for (player_id, websocket, _), result in zip(outgoing, results, strict=True):
+            if isinstance(result, BaseException):
+                print(f"   ❌ Failed to send to {player_id}: {result}")
+                # Remove unless the player already reconnected with a new socket
+                if self.connections.get(player_id) is websocket:
+                    del self.connections[player_id]
+                    print(f"   🗑️ Removed disconnected player: {player_id}")
+            else:
                 print(f"   ✅ Sent to {player_id}")
-            except Exception as e:
-                print(f"   ❌ Failed to send to {player_id}: {e}")
-                # Mark for removal if send fails
-                disconnected.append(player_id)
-
-        # Remove disconnected players
-        for player_id in disconnected:
-            del self.connections[player_id]
-            print(f"   🗑️ Removed disconnected player: {player_id}")
 
     def __repr__(self) -> str:
         return f"GameSession(id={self.game_id}, state={self.state}, players={len(self.players)})"
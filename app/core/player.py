@@ -7,6 +7,8 @@ from datetime import datetime
 class Player:
     """Represents a player in the game."""
 
+    __slots__ = ("id", "nickname", "role", "is_alive", "is_host", "knows_word", "joined_at")
+
     def __init__(self, nickname: str, is_host: bool = False):
         """Initialize a new player.
 
@@ -1,6 +1,7 @@
 """Middleware package for Dragonseeker."""
 
+from .profiler import ProfilerMiddleware
 from .rate_limiter import RateLimitMiddleware
 from .security_headers import SecurityHeadersMiddleware
 
-__all__ = ["RateLimitMiddleware", "SecurityHeadersMiddleware"]
+__all__ = ["ProfilerMiddleware", "RateLimitMiddleware", "SecurityHeadersMiddleware"]
@@ -0,0 +1,44 @@
+"""Request profiling middleware (opt-in, for diagnosing hot endpoints)."""
+
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.requests import Request
+from starlette.responses import HTMLResponse, Response
+from starlette.types import ASGIApp
+
+
+class ProfilerMiddleware(BaseHTTPMiddleware):
+    """Middleware to profile requests that carry a ``__profile`` query parameter."""
+
+    def __init__(self, app: ASGIApp):
+        """Initialize middleware.
+
+        Requires the optional ``pyinstrument`` package (``uv sync --group profiling``).
+
+        Args:
+            app: ASGI application
+        """
+        super().__init__(app)
+
+        from pyinstrument import Profiler
+
+        self.profiler_class = Profiler
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        """Profile the request and return the report instead of the response.
+
+        Args:
+            request: The incoming request
+            call_next: The next middleware/handler
+
+        Returns:
+            HTML profile report if requested, otherwise the normal response
+        """
+        if "__profile" not in request.query_params:
+            return await call_next(request)
+
+        profiler = self.profiler_class(async_mode="enabled")
+        profiler.start()
+        await call_next(request)
+        profiler.stop()
+
+        return HTMLResponse(profiler.output_html())
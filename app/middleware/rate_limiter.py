@@ -2,6 +2,7 @@
 
 import time
 from collections import defaultdict
+from collections.abc import Hashable
 
 from fastapi.responses import JSONResponse
 from starlette.types import ASGIApp, Receive, Scope, Send
@@ -66,6 +67,60 @@ class RateLimiter:
         self.last_cleanup = now
 
 
+class TokenBucket:
+    """Track request rates per key (e.g. game/player pair) using token buckets."""
+
+    def __init__(self, rate: float, capacity: float):
+        """Initialize token bucket tracking.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens a bucket can hold (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        # Dictionary: key -> (last update timestamp, tokens available)
+        self.buckets: dict[Hashable, tuple[float, float]] = {}
+        self.last_cleanup = time.monotonic()
+        self.cleanup_interval = 60  # Clean up every 60 seconds
+
+    def is_allowed(self, key: Hashable) -> bool:
+        """Take a token from the key's bucket if one is available.
+
+        Args:
+            key: Bucket key
+
+        Returns:
+            True if request is allowed, False if the bucket is empty
+        """
+        now = time.monotonic()
+        last, tokens = self.buckets.get(key, (now, self.capacity))
+        tokens = min(self.capacity, tokens + (now - last) * self.rate)
+
+        if tokens < 1.0:
+            self.buckets[key] = (now, tokens)
+            return False
+
+        self.buckets[key] = (now, tokens - 1.0)
+        return True
+
+    def cleanup_old_entries(self):
+        """Remove buckets that have refilled completely to prevent memory leaks."""
+        now = time.monotonic()
+
+        # Only run cleanup periodically
+        if now - self.last_cleanup < self.cleanup_interval:
+            return
+
+        # A bucket idle long enough to refill is the same as a fresh one
+        refill_time = self.capacity / self.rate
+        self.buckets = {
+            key: bucket for key, bucket in self.buckets.items() if now - bucket[0] < refill_time
+        }
+
+        self.last_cleanup = now
+
+
 def get_rate_limit(path: str) -> int | None:
     """Get rate limit for endpoint.
 
@@ -37,3 +37,11 @@ class GuessWordRequest(BaseModel):
     def clean_guess(cls, v: str) -> str:
         """Clean the guess."""
         return v.strip().lower()
+
+
+class SetTimerRequest(BaseModel):
+    """Request to set the voting timer."""
+
+    timer_seconds: int | None = Field(
+        None, ge=30, le=180, description="Voting timer in seconds, or None to disable"
+    )
@@ -0,0 +1,76 @@
+"""Shared FastAPI dependencies for game routes."""
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from fastapi import Depends, HTTPException, Request
+
+from core.auth import get_player_id, get_token_data, verify_token_matches
+from core.game_manager import game_manager
+from core.game_session import GameSession
+from core.player import Player
+
+
+async def get_base_url(request: Request) -> str:
+    """Get the request's base URL as a string without trailing slash.
+
+    Computed once per request and kept on request.state, so any dependency or
+    handler asking for it reuses the same string.
+
+    Args:
+        request: The FastAPI request object
+
+    Returns:
+        Base URL, e.g. "https://dragonseeker.win"
+    """
+    base_url = getattr(request.state, "base_url", None)
+    if base_url is None:
+        base_url = request.state.base_url = str(request.base_url).rstrip("/")
+    return base_url
+
+
+def require_host(action: str) -> Callable[..., Awaitable[tuple[GameSession, Player]]]:
+    """Build a dependency that resolves the game and checks the caller is its host.
+
+    Args:
+        action: What the host is allowed to do, used in the 403 message
+            (e.g. "start the game" -> "Only host can start the game")
+
+    Returns:
+        Dependency returning (game, player) for an authenticated host
+    """
+    detail = f"Only host can {action}"
+
+    async def dependency(
+        game_id: str,
+        player_id: str = Depends(get_player_id),  # noqa: B008
+        token_data: dict[str, Any] = Depends(get_token_data),  # noqa: B008
+    ) -> tuple[GameSession, Player]:
+        """Resolve the game and player, requiring the player to be the host.
+
+        Args:
+            game_id: The game session ID (from the path)
+            player_id: The player's ID (injected)
+            token_data: Authenticated token data (injected)
+
+        Returns:
+            Tuple of (game, player) for the host
+
+        Raises:
+            HTTPException: 403 if the token doesn't match or the player isn't the
+                host, 404 if the game doesn't exist
+        """
+        # Verify token matches the requested player
+        verify_token_matches(token_data, game_id, player_id)
+
+        game, player = game_manager.get_game_and_player(game_id, player_id)
+
+        if not game:
+            raise HTTPException(status_code=404, detail="Game not found")
+
+        if not player or not player.is_host:
+            raise HTTPException(status_code=403, detail=detail)
+
+        return game, player
+
+    return dependency
@@ -1,13 +1,13 @@
 """Routes for game creation and joining."""
 
 from fastapi import APIRouter, Form, HTTPException, Request, Response
-from fastapi.templating import Jinja2Templates
 
-from core.auth import generate_player_token, get_secret_key
+from core.auth import generate_player_token, get_secret_key, player_cookie_name
 from core.game_manager import game_manager
+from routes.templating import templates
+from routes.urls import join_url, lobby_url
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
 
 
 @router.post("/api/games/create")
@@ -20,7 +20,7 @@ async def create_game(response: Response):
     game = game_manager.create_game()
 
     # Use HTMX's HX-Redirect header for client-side redirect
-    response.headers["HX-Redirect"] = f"/game/{game.game_id}/join"
+    response.headers["HX-Redirect"] = join_url(game.game_id)
 
     return {"status": "created", "game_id": game.game_id}
 
@@ -106,7 +106,7 @@ async def join_game(game_id: str, response: Response, nickname: str = Form(...))
 
     is_development = os.getenv("ENVIRONMENT") == "development"
     response.set_cookie(
-        key=f"player_token_{player.id}",
+        key=player_cookie_name(player.id),
         value=token,
         httponly=True,
         secure=not is_development,  # HTTPS by default, HTTP only in development
@@ -114,10 +114,10 @@ async def join_game(game_id: str, response: Response, nickname: str = Form(...))
         max_age=86400,  # 24 hours
     )
 
-    # Broadcast update to all connected players
-    await game.broadcast_state()
+    # Broadcast update to all connected players (joins in quick succession share one)
+    game.schedule_broadcast()
 
     # Use HTMX's HX-Redirect header for client-side redirect
-    response.headers["HX-Redirect"] = f"/game/{game_id}/lobby?player_id={player.id}"
+    response.headers["HX-Redirect"] = lobby_url(game_id, player.id)
 
     return {"status": "joined", "player_id": player.id}
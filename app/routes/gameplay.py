@@ -2,14 +2,19 @@
 
 from typing import Any
 
-from fastapi import APIRouter, Depends, Form, HTTPException, Query, Request, Response
-from fastapi.responses import RedirectResponse
-from fastapi.templating import Jinja2Templates
+from fastapi import APIRouter, Depends, Form, HTTPException, Request, Response
+from fastapi.responses import HTMLResponse, RedirectResponse
 
-from core.auth import get_token_data, verify_token_matches
+from core.auth import get_player_id, get_token_data, verify_token_matches
+from core.constants import TIMER_CACHE_MAX_SIZE, TIMER_RATE_LIMIT
 from core.game_manager import game_manager
-from core.game_session import GameState
+from core.game_session import GameSession, GameState
+from core.player import Player
 from core.roles import Role
+from middleware.rate_limiter import TokenBucket
+from routes.dependencies import require_host
+from routes.templating import template_loader, templates
+from routes.urls import lobby_url, results_url
 from services.game_state import (
     can_start_voting,
     transition_to_finished,
@@ -20,14 +25,21 @@ from services.voting import all_votes_submitted, can_vote
 from services.win_conditions import check_dragon_eliminated, determine_winner
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
+
+# Timer partial is compiled once (re-checked per render in development);
+# static (hidden/expired) snippets are cached outside development
+_timer_template = template_loader("partials/timer.html")
+_timer_cache: dict[tuple[str, str, bool], str] = {}
+
+# Per game/player limit on timer polls, checked before any game lookup
+_timer_limiter = TokenBucket(rate=TIMER_RATE_LIMIT, capacity=TIMER_RATE_LIMIT)
 
 
 @router.get("/game/{game_id}/play")
 async def show_game(
     request: Request,
     game_id: str,
-    player_id: str = Query(...),
+    player_id: str = Depends(get_player_id),  # noqa: B008
     token_data: dict[str, Any] = Depends(get_token_data),  # noqa: B008
 ):
     """Show the active game interface.
@@ -59,11 +71,11 @@ async def show_game(
 
     # Redirect to lobby if game hasn't started
     if game.state == GameState.LOBBY:
-        return RedirectResponse(url=f"/game/{game_id}/lobby?player_id={player_id}")
+        return RedirectResponse(url=lobby_url(game_id, player_id))
 
     # Redirect to results if game is finished
     if game.state == GameState.FINISHED:
-        return RedirectResponse(url=f"/game/{game_id}/results?player_id={player_id}")
+        return RedirectResponse(url=results_url(game_id, player_id))
 
     # Determine which word to show based on player's role
     word = None
@@ -83,8 +95,7 @@ async def show_game(
 @router.post("/api/games/{game_id}/start-voting")
 async def start_voting(
     game_id: str,
-    player_id: str = Query(...),
-    token_data: dict[str, Any] = Depends(get_token_data),  # noqa: B008
+    host: tuple[GameSession, Player] = Depends(require_host("start voting")),  # noqa: B008
 ):
     """Transition game to voting phase.
 
@@ -92,8 +103,7 @@ async def start_voting(
 
     Args:
         game_id: The game session ID
-        player_id: The player's ID (must be host)
-        token_data: Authenticated token data (injected)
+        host: Authenticated (game, player) for the host (injected)
 
     Returns:
         Success message
@@ -101,18 +111,7 @@ async def start_voting(
     Raises:
         HTTPException: If validation fails or authentication fails
     """
-    # Verify token matches the requested player
-    verify_token_matches(token_data, game_id, player_id)
-
-    game = game_manager.get_game(game_id)
-
-    if not game:
-        raise HTTPException(status_code=404, detail="Game not found")
-
-    player = game.players.get(player_id)
-
-    if not player or not player.is_host:
-        raise HTTPException(status_code=403, detail="Only host can start voting")
+    game, _ = host
 
     can_vote_now, error_msg = can_start_voting(game)
     if not can_vote_now:
@@ -122,11 +121,9 @@ async def start_voting(
     transition_to_voting(game)
 
     # Set voting start timestamp if timer configured
+    game.start_voting_timer()
     if game.voting_timer_seconds is not None:
-        from datetime import datetime
-
-        game.voting_started_at = datetime.now()
-        print(f"⏱️ Starting timer: {game.voting_timer_seconds}s at {game.voting_started_at}")
+        print(f"⏱️ Starting timer: {game.voting_timer_seconds}s")
     else:
         print("⏱️ No timer configured (voting_timer_seconds is None)")
 
@@ -136,62 +133,97 @@ async def start_voting(
     return {"status": "voting_started", "timer_seconds": game.voting_timer_seconds}
 
 
+def _render_timer(
+    game_id: str,
+    player_id: str,
+    show_timer: bool = False,
+    expired: bool = False,
+    time_remaining: int | None = None,
+) -> HTMLResponse:
+    """Render the timer partial, reusing previously rendered static HTML.
+
+    The hidden and expired snippets only depend on game, player and expiry,
+    and are re-polled every second, so they are cached. Countdown snippets
+    change every second and are rendered directly: caching them would only
+    fill the cache with entries that are never read again.
+
+    Args:
+        game_id: The game session ID
+        player_id: The player's ID
+        show_timer: Whether to show the countdown
+        expired: Whether the voting timer just expired
+        time_remaining: Seconds remaining (required when show_timer is True)
+
+    Returns:
+        HTML response with the timer snippet
+    """
+    context: dict[str, Any] = {
+        "show_timer": show_timer,
+        "expired": expired,
+        "game_id": game_id,
+        "player_id": player_id,
+    }
+
+    if show_timer and time_remaining is not None:
+        context["time_remaining"] = time_remaining
+        context["minutes"] = time_remaining // 60
+        context["seconds"] = f"{time_remaining % 60:02d}"  # Zero-pad seconds
+        return HTMLResponse(content=_timer_template().render(context))
+
+    # In development the template may change on disk, so render every time
+    if templates.env.auto_reload:
+        return HTMLResponse(content=_timer_template().render(context))
+
+    cache_key = (game_id, player_id, expired)
+    html = _timer_cache.get(cache_key)
+
+    if html is None:
+        html = _timer_template().render(context)
+
+        if len(_timer_cache) >= TIMER_CACHE_MAX_SIZE:
+            _timer_cache.clear()
+        _timer_cache[cache_key] = html
+
+    return HTMLResponse(content=html)
+
+
 @router.get("/api/games/{game_id}/timer")
-async def get_timer(request: Request, game_id: str, player_id: str = Query(...)):
+async def get_timer(
+    game_id: str,
+    player_id: str = Depends(get_player_id),  # noqa: B008
+):
     """Get voting timer HTML (polled by HTMX every second).
 
     Note: No authentication required for performance (high-frequency polling).
     Rate limited to 20 req/s and validates player exists/is alive.
 
     Args:
-        request: The FastAPI request object
         game_id: The game session ID
         player_id: The player's ID
 
     Returns:
-        Rendered timer HTML snippet
+        Rendered timer HTML snippet, or 204 if polling too fast
     """
+    if not _timer_limiter.is_allowed((game_id, player_id)):
+        # 204 makes HTMX keep the current timer element and poll again
+        return Response(status_code=204)
+
+    _timer_limiter.cleanup_old_entries()
+
     game = game_manager.get_game(game_id)
 
     if not game:
         # Return empty div if game not found
-        return templates.TemplateResponse(
-            request=request,
-            name="partials/timer.html",
-            context={
-                "show_timer": False,
-                "expired": False,
-                "game_id": game_id,
-                "player_id": player_id,
-            },
-        )
+        return _render_timer(game_id, player_id)
 
     player = game.players.get(player_id)
     if not player or not player.is_alive:
         # Dead players don't see timer
-        return templates.TemplateResponse(
-            request=request,
-            name="partials/timer.html",
-            context={
-                "show_timer": False,
-                "expired": False,
-                "game_id": game_id,
-                "player_id": player_id,
-            },
-        )
+        return _render_timer(game_id, player_id)
 
     # Check if in voting state with timer
     if game.state != GameState.VOTING or not game.voting_timer_seconds:
-        return templates.TemplateResponse(
-            request=request,
-            name="partials/timer.html",
-            context={
-                "show_timer": False,
-                "expired": False,
-                "game_id": game_id,
-                "player_id": player_id,
-            },
-        )
+        return _render_timer(game_id, player_id)
 
     # Calculate time remaining
     time_remaining = game.get_voting_time_remaining()
@@ -203,35 +235,12 @@ async def get_timer(request: Request, game_id: str, player_id: str = Query(...))
         transition_to_playing(game)
         await game.broadcast_state()
 
-        return templates.TemplateResponse(
-            request=request,
-            name="partials/timer.html",
-            context={
-                "show_timer": False,
-                "expired": True,
-                "game_id": game_id,
-                "player_id": player_id,
-            },
-        )
+        return _render_timer(game_id, player_id, expired=True)
 
     # Show countdown (time_remaining is guaranteed to be > 0 here)
     assert time_remaining is not None and time_remaining > 0
-    minutes = time_remaining // 60
-    seconds = time_remaining % 60
 
-    return templates.TemplateResponse(
-        request=request,
-        name="partials/timer.html",
-        context={
-            "show_timer": True,
-            "expired": False,
-            "time_remaining": time_remaining,
-            "minutes": minutes,
-            "seconds": f"{seconds:02d}",  # Zero-pad seconds
-            "game_id": game_id,
-            "player_id": player_id,
-        },
-    )
+    return _render_timer(game_id, player_id, show_timer=True, time_remaining=time_remaining)
 
 
 @router.post("/api/games/{game_id}/vote")
@@ -239,7 +248,7 @@ async def submit_vote(
     game_id: str,
     response: Response,
     target_id: str = Form(...),
-    player_id: str = Query(...),
+    player_id: str = Depends(get_player_id),  # noqa: B008
     token_data: dict[str, Any] = Depends(get_token_data),  # noqa: B008
 ):
     """Submit a vote for player elimination.
@@ -289,7 +298,7 @@ async def submit_vote(
         elif winner:
             transition_to_finished(game, winner)
             # Redirect to results page when game is finished
-            response.headers["HX-Redirect"] = f"/game/{game_id}/results?player_id={player_id}"
+            response.headers["HX-Redirect"] = results_url(game_id, player_id)
         else:
             # Continue playing
             transition_to_playing(game)
@@ -307,11 +316,10 @@ async def submit_vote(
     # Vote submitted, waiting for others
     await game.broadcast_state()
 
-    alive_count = sum(1 for p in game.players.values() if p.is_alive)
     return {
         "status": "vote_submitted",
         "votes_submitted": len(game.votes),
-        "total_players": alive_count,
+        "total_players": game.alive_count,
     }
 
 
@@ -320,7 +328,7 @@ async def guess_word(
     game_id: str,
     response: Response,
     guess: str = Form(...),
-    player_id: str = Query(...),
+    player_id: str = Depends(get_player_id),  # noqa: B008
     token_data: dict[str, Any] = Depends(get_token_data),  # noqa: B008
 ):
     """Dragon attempts to guess the secret word after elimination.
@@ -354,7 +362,7 @@ async def guess_word(
     if game.state != GameState.DRAGON_GUESS:
         raise HTTPException(status_code=400, detail="Not in dragon guess phase")
 
-    if not game.villager_word:
+    if not game.villager_word_lower:
         raise HTTPException(status_code=500, detail="Game state error: word not set")
 
     # Clean and validate guess
@@ -368,7 +376,7 @@ async def guess_word(
         raise HTTPException(status_code=400, detail="Guess cannot be empty")
 
     # Check if guess is correct (check against villager word)
-    correct = guess == game.villager_word.lower()
+    correct = guess == game.villager_word_lower
 
     # Set winner
     winner = "dragon" if correct else "villagers"
@@ -380,7 +388,7 @@ async def guess_word(
     await game.broadcast_state()
 
     # Redirect to results page
-    response.headers["HX-Redirect"] = f"/game/{game_id}/results?player_id={player_id}"
+    response.headers["HX-Redirect"] = results_url(game_id, player_id)
 
     return {"correct": correct, "winner": winner}
 
@@ -389,7 +397,7 @@ async def guess_word(
 async def show_results(
     request: Request,
     game_id: str,
-    player_id: str = Query(...),
+    player_id: str = Depends(get_player_id),  # noqa: B008
     token_data: dict[str, Any] = Depends(get_token_data),  # noqa: B008
 ):
     """Show the game results page.
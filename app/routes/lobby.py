@@ -1,33 +1,48 @@
 """Routes for lobby management."""
 
+import logging
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
-from fastapi.responses import RedirectResponse
-from fastapi.templating import Jinja2Templates
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.responses import HTMLResponse, RedirectResponse
 
-from core.auth import get_token_data, verify_token_matches
+from core.auth import get_player_id, get_token_data, verify_token_matches
+from core.constants import MIN_PLAYERS
 from core.game_manager import game_manager
+from core.game_session import GameSession
+from core.player import Player
+from models.requests import SetTimerRequest
+from routes.dependencies import get_base_url, require_host
+from routes.templating import template_loader
+from routes.urls import join_url, play_url
 from services.game_state import can_start_game
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
+
+# Lobby page is rendered directly (no TemplateResponse wrapping); compiled once
+# outside development, re-checked for edits on every render with auto_reload
+_lobby_template = template_loader("lobby.html")
+
+# Lobby template values that never change between requests
+_LOBBY_CONST_CONTEXT: dict[str, Any] = {"min_players": MIN_PLAYERS}
 
 
 @router.get("/game/{game_id}/lobby")
 async def show_lobby(
-    request: Request,
     game_id: str,
-    player_id: str = Query(...),
+    player_id: str = Depends(get_player_id),  # noqa: B008
     token_data: dict[str, Any] = Depends(get_token_data),  # noqa: B008
+    base_url: str = Depends(get_base_url),  # noqa: B008
 ):
     """Show the lobby page with player list and start button.
 
     Args:
-        request: The FastAPI request object
         game_id: The game session ID
         player_id: The player's ID (from query param)
         token_data: Authenticated token data (injected)
+        base_url: Request base URL without trailing slash (injected)
 
     Returns:
         Rendered lobby page template
@@ -38,40 +53,36 @@ async def show_lobby(
     # Verify token matches the requested player
     verify_token_matches(token_data, game_id, player_id)
 
-    game = game_manager.get_game(game_id)
+    game, player = game_manager.get_game_and_player(game_id, player_id)
 
     if not game:
         raise HTTPException(status_code=404, detail="Game not found")
 
-    player = game.players.get(player_id)
-
     if not player:
         # Player not in game, redirect to join page
-        return RedirectResponse(url=f"/game/{game_id}/join")
+        return RedirectResponse(url=join_url(game_id))
 
     # Build share URL
-    share_url = str(request.base_url).rstrip("/") + f"/game/{game_id}/join"
-
-    return templates.TemplateResponse(
-        request=request,
-        name="lobby.html",
-        context={
-            "game": game,
-            "player": player,
-            "player_id": player_id,
-            "is_host": player.is_host,
-            "share_url": share_url,
-            "min_players": 3,
-        },
-    )
+    share_url = base_url + join_url(game_id)
+
+    context = {
+        "game": game,
+        "player": player,
+        "player_id": player_id,
+        "is_host": player.is_host,
+        "share_url": share_url,
+    }
+    context |= _LOBBY_CONST_CONTEXT
+
+    html = _lobby_template().render(context)
+    return HTMLResponse(content=html)
 
 
 @router.post("/api/games/{game_id}/start")
 async def start_game(
     game_id: str,
     response: Response,
-    player_id: str = Query(...),
-    token_data: dict[str, Any] = Depends(get_token_data),  # noqa: B008
+    host: tuple[GameSession, Player] = Depends(require_host("start the game")),  # noqa: B008
 ):
     """Start the game (assign roles and transition to playing).
 
@@ -79,9 +90,8 @@ async def start_game(
 
     Args:
         game_id: The game session ID
-        player_id: The player's ID (must be host)
         response: FastAPI response object
-        token_data: Authenticated token data (injected)
+        host: Authenticated (game, player) for the host (injected)
 
     Returns:
         Success message with redirect header
@@ -89,18 +99,7 @@ async def start_game(
     Raises:
         HTTPException: If validation fails or authentication fails
     """
-    # Verify token matches the requested player
-    verify_token_matches(token_data, game_id, player_id)
-
-    game = game_manager.get_game(game_id)
-
-    if not game:
-        raise HTTPException(status_code=404, detail="Game not found")
-
-    player = game.players.get(player_id)
-
-    if not player or not player.is_host:
-        raise HTTPException(status_code=403, detail="Only host can start the game")
+    game, player = host
 
     can_start, error_msg = can_start_game(game)
     if not can_start:
@@ -113,7 +112,7 @@ async def start_game(
     await game.broadcast_state()
 
     # Redirect to game page
-    response.headers["HX-Redirect"] = f"/game/{game_id}/play?player_id={player_id}"
+    response.headers["HX-Redirect"] = play_url(game_id, player.id)
 
     return {"status": "started", "game_id": game_id}
 
@@ -121,17 +120,15 @@ async def start_game(
 @router.post("/api/games/{game_id}/set-timer")
 async def set_timer(
     game_id: str,
-    request: Request,
-    player_id: str = Query(...),
-    token_data: dict[str, Any] = Depends(get_token_data),  # noqa: B008
+    body: SetTimerRequest,
+    host: tuple[GameSession, Player] = Depends(require_host("set timer")),  # noqa: B008
 ):
     """Set voting timer for all rounds (host only).
 
     Args:
         game_id: The game session ID
-        request: Request with timer_seconds in JSON body
-        player_id: The player's ID (must be host)
-        token_data: Authenticated token data (injected)
+        body: JSON body with timer_seconds (30-180 or null)
+        host: Authenticated (game, player) for the host (injected)
 
     Returns:
         Success message
@@ -139,29 +136,17 @@ async def set_timer(
     Raises:
         HTTPException: If validation fails or authentication fails
     """
-    # Verify token matches the requested player
-    verify_token_matches(token_data, game_id, player_id)
-
-    game = game_manager.get_game(game_id)
-
-    if not game:
-        raise HTTPException(status_code=404, detail="Game not found")
-
-    player = game.players.get(player_id)
-
-    if not player or not player.is_host:
-        raise HTTPException(status_code=403, detail="Only host can set timer")
+    game, _ = host
 
-    body = await request.json()
-    timer_seconds = body.get("timer_seconds")
+    timer_seconds = body.timer_seconds
 
-    print(f"⏱️ Setting timer for game {game_id}: {timer_seconds}s")
+    logger.debug("⏱️ Setting timer for game %s: %ss", game_id, timer_seconds)
 
     try:
         game.set_voting_timer(timer_seconds)
-        print(f"⏱️ Timer set successfully: game.voting_timer_seconds = {game.voting_timer_seconds}")
+        logger.debug("⏱️ Timer set successfully: %ss", game.voting_timer_seconds)
     except ValueError as e:
-        print(f"⏱️ Timer validation error: {e}")
+        logger.debug("⏱️ Timer validation error: %s", e)
         raise HTTPException(status_code=400, detail=str(e)) from e
 
     return {"status": "timer_set", "timer_seconds": timer_seconds}
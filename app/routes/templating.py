@@ -0,0 +1,37 @@
+"""Shared Jinja2 template configuration."""
+
+import os
+from collections.abc import Callable
+from functools import partial
+
+from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache, Template
+
+templates = Jinja2Templates(directory="templates")
+
+# Templates only change on deploy, so skip the per-lookup file stat outside development
+templates.env.auto_reload = os.getenv("ENVIRONMENT") == "development"
+
+# Persist compiled template bytecode so restarts skip re-parsing
+templates.env.bytecode_cache = FileSystemBytecodeCache()
+
+
+def template_loader(name: str) -> Callable[[], Template]:
+    """Get a callable returning the compiled template for direct rendering.
+
+    Outside development the template is loaded once and the same object is
+    returned on every call. With auto_reload on, each call goes through
+    get_template, which is where Jinja checks for changes on disk, so edits
+    show up without restarting.
+
+    Args:
+        name: Template path relative to the templates directory
+
+    Returns:
+        Zero-argument callable returning the Template
+    """
+    if templates.env.auto_reload:
+        return partial(templates.get_template, name)
+
+    template = templates.get_template(name)
+    return lambda: template
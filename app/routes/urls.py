@@ -0,0 +1,10 @@
+"""Page URL templates shared by route handlers.
+
+Each template is a bound str.format, so building a URL is a single call
+instead of re-evaluating an f-string at every redirect site.
+"""
+
+join_url = "/game/{}/join".format  # (game_id)
+lobby_url = "/game/{}/lobby?player_id={}".format  # (game_id, player_id)
+play_url = "/game/{}/play?player_id={}".format  # (game_id, player_id)
+results_url = "/game/{}/results?player_id={}".format  # (game_id, player_id)
@@ -5,7 +5,7 @@ import json
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
-from core.auth import get_secret_key, verify_player_token
+from core.auth import get_secret_key, player_cookie_name, verify_player_token
 from core.game_manager import game_manager
 
 router = APIRouter()
@@ -31,8 +31,7 @@ async def websocket_endpoint(websocket: WebSocket, game_id: str, player_id: str)
     print(f"🔌 WebSocket connection attempt: game={game_id}, player={player_id}")
 
     # Authenticate player via cookie (use player-specific cookie name)
-    cookie_name = f"player_token_{player_id}"
-    player_token = websocket.cookies.get(cookie_name)
+    player_token = websocket.cookies.get(player_cookie_name(player_id))
     secret_key = get_secret_key()
     token_data = verify_player_token(player_token, secret_key)
 
@@ -2,6 +2,7 @@
 
 from datetime import datetime
 
+from core.auth import invalidate_game_tokens
 from core.game_session import GameSession, GameState
 
 
@@ -35,8 +36,7 @@ def can_start_voting(game: GameSession) -> tuple[bool, str]:
     if game.state != GameState.PLAYING:
         return False, "Can only start voting from playing state"
 
-    alive_count = sum(1 for p in game.players.values() if p.is_alive)
-    if alive_count < 2:
+    if game.alive_count < 2:
         return False, "Need at least 2 alive players to vote"
 
     return True, ""
@@ -72,3 +72,6 @@ def transition_to_finished(game: GameSession, winner: str) -> None:
     game.state = GameState.FINISHED
     game.winner = winner
     game.finished_at = datetime.now()
+
+    # Players of a finished game no longer need their tokens kept hot
+    invalidate_game_tokens(game.game_id)
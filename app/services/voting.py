@@ -38,5 +38,4 @@ def all_votes_submitted(game: GameSession) -> bool:
     Returns:
         True if all alive players have submitted votes
     """
-    alive_count = sum(1 for p in game.players.values() if p.is_alive)
-    return len(game.votes) >= alive_count
+    return len(game.votes) >= game.alive_count
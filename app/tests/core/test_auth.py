@@ -1,10 +1,34 @@
 """Tests for authentication and token management."""
 
 import time
+from types import SimpleNamespace
 
+import pytest
 from fastapi.testclient import TestClient
 
-from core.auth import generate_player_token, verify_player_token
+from core import auth
+from core.auth import (
+    _verified_tokens,
+    generate_player_token,
+    invalidate_game_tokens,
+    verify_player_token,
+)
+from core.constants import TOKEN_CACHE_TTL_SECONDS
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Replace time.time with a settable clock (advance by changing .now)."""
+    clock = SimpleNamespace(now=1_700_000_000.0)
+    monkeypatch.setattr(time, "time", lambda: clock.now)
+    return clock
+
+
+@pytest.fixture(autouse=True)
+def reset_token_cache():
+    """Clear the verified-token cache before each test."""
+    _verified_tokens.clear()
+    yield
 
 
 class TestTokenGeneration:
@@ -36,6 +60,22 @@ class TestTokenGeneration:
         token_data = verify_player_token(invalid_token, secret_key)
         assert token_data is None
 
+    def test_verify_malformed_tokens_return_none(self):
+        """Test that tokens with a malformed payload are rejected."""
+        secret_key = "test_secret_key_12345"
+        token = generate_player_token("game123", "player456", secret_key)
+        _, signature_b64 = token.split(".")
+
+        malformed_tokens = [
+            "no-separator",
+            f"game123:player456.{signature_b64}",  # Missing expiry
+            f"game123:player456:soon.{signature_b64}",  # Non-numeric expiry
+            f"game123:player456:1:2.{signature_b64}",  # Extra payload field
+            f"{token}.extra",  # Extra signature segment
+        ]
+        for malformed in malformed_tokens:
+            assert verify_player_token(malformed, secret_key) is None
+
     def test_verify_token_with_wrong_secret_fails(self):
         """Test that a token verified with wrong secret fails."""
         secret_key = "test_secret_key_12345"
@@ -79,6 +119,105 @@ class TestTokenGeneration:
         assert token_data is None
 
 
+class TestVerifiedTokenCache:
+    """Test caching of verified tokens."""
+
+    def test_verified_token_is_cached(self):
+        """Test that a successfully verified token is served from cache."""
+        secret_key = "test_secret_key_12345"
+        token = generate_player_token("game123", "player456", secret_key)
+
+        first = verify_player_token(token, secret_key)
+        assert (token, secret_key) in _verified_tokens
+
+        second = verify_player_token(token, secret_key)
+        assert second == first
+
+    def test_invalid_token_is_not_cached(self):
+        """Test that tokens failing verification never enter the cache."""
+        secret_key = "test_secret_key_12345"
+        token = generate_player_token("game123", "player456", secret_key)
+        payload, _ = token.split(".")
+        forged_token = f"{payload}.{'A' * 43}"
+
+        assert verify_player_token(forged_token, secret_key) is None
+        assert verify_player_token(token, "wrong_secret_key_12345") is None
+        assert _verified_tokens == {}
+
+    def test_cached_token_not_valid_for_other_secret(self):
+        """Test that a cached token is not accepted under a different secret."""
+        secret_key = "test_secret_key_12345"
+        token = generate_player_token("game123", "player456", secret_key)
+
+        assert verify_player_token(token, secret_key) is not None
+        assert verify_player_token(token, "wrong_secret_key_12345") is None
+
+    def test_invalidate_game_tokens(self):
+        """Test that invalidating a game drops only that game's tokens."""
+        secret_key = "test_secret_key_12345"
+        token_a = generate_player_token("gameA", "player1", secret_key)
+        token_b = generate_player_token("gameB", "player2", secret_key)
+        verify_player_token(token_a, secret_key)
+        verify_player_token(token_b, secret_key)
+
+        invalidate_game_tokens("gameA")
+
+        assert (token_a, secret_key) not in _verified_tokens
+        assert (token_b, secret_key) in _verified_tokens
+        # Token itself is still valid and is simply re-verified
+        assert verify_player_token(token_a, secret_key) is not None
+
+    def test_entry_past_cache_ttl_is_reverified(self, fake_clock, monkeypatch):
+        """Test that an entry past cached_until is dropped and the token re-verified."""
+        secret_key = "test_secret_key_12345"
+        token = generate_player_token("game123", "player456", secret_key)
+        sign_calls = []
+        real_sign = auth._sign
+
+        def counting_sign(payload: str, key: str) -> bytes:
+            sign_calls.append(payload)
+            return real_sign(payload, key)
+
+        monkeypatch.setattr(auth, "_sign", counting_sign)
+
+        verify_player_token(token, secret_key)
+        verify_player_token(token, secret_key)
+        assert len(sign_calls) == 1  # Second call served from cache
+
+        fake_clock.now += TOKEN_CACHE_TTL_SECONDS + 1
+        assert verify_player_token(token, secret_key) is not None
+
+        assert len(sign_calls) == 2
+        cached_until = _verified_tokens[(token, secret_key)][3]
+        assert cached_until == fake_clock.now + TOKEN_CACHE_TTL_SECONDS
+
+    def test_full_cache_evicts_oldest_entry(self, monkeypatch):
+        """Test that a cache at TOKEN_CACHE_MAX_SIZE evicts its oldest entry."""
+        monkeypatch.setattr(auth, "TOKEN_CACHE_MAX_SIZE", 2)
+        secret_key = "test_secret_key_12345"
+        tokens = [generate_player_token("game123", f"player{i}", secret_key) for i in range(3)]
+
+        for token in tokens:
+            verify_player_token(token, secret_key)
+
+        assert list(_verified_tokens) == [(tokens[1], secret_key), (tokens[2], secret_key)]
+
+    def test_cache_entry_capped_at_token_expiry(self, fake_clock):
+        """Test that cached_until never extends past the token's own expiry."""
+        secret_key = "test_secret_key_12345"
+        token = generate_player_token("game123", "player456", secret_key)
+        expiry = int(fake_clock.now) + 86400
+
+        # Less than one cache TTL before the token expires
+        fake_clock.now = expiry - TOKEN_CACHE_TTL_SECONDS // 2
+        assert verify_player_token(token, secret_key) is not None
+
+        assert _verified_tokens[(token, secret_key)][3] == expiry
+
+        fake_clock.now = expiry + 1
+        assert verify_player_token(token, secret_key) is None
+
+
 class TestAuthenticationIntegration:
     """Test authentication integration with endpoints."""
 
@@ -118,6 +257,10 @@ class TestAuthenticationIntegration:
         other_player_response = client.get(f"/game/{game_id}/lobby?player_id=different_player")
         assert other_player_response.status_code == 401  # No cookie for this player_id
 
+        # Missing player_id is rejected before any token lookup
+        missing_player_response = client.get(f"/game/{game_id}/lobby")
+        assert missing_player_response.status_code == 400
+
         # Create new client without cookies (no token)
         client_no_auth = TestClient(app)
         no_auth_response = client_no_auth.get(f"/game/{game_id}/lobby?player_id={player_id}")
@@ -0,0 +1,28 @@
+"""Tests for game manager."""
+
+from core.game_manager import GameManager
+
+
+class TestGetGameAndPlayer:
+    """Tests for GameManager.get_game_and_player."""
+
+    def test_returns_game_and_player(self):
+        """Test that both game and player are returned when they exist."""
+        manager = GameManager()
+        game = manager.create_game()
+        player = game.add_player("Alice")
+
+        assert manager.get_game_and_player(game.game_id, player.id) == (game, player)
+
+    def test_unknown_player_returns_game_only(self):
+        """Test that an unknown player yields the game and None."""
+        manager = GameManager()
+        game = manager.create_game()
+
+        assert manager.get_game_and_player(game.game_id, "non-existent-id") == (game, None)
+
+    def test_unknown_game_returns_nothing(self):
+        """Test that an unknown game yields (None, None)."""
+        manager = GameManager()
+
+        assert manager.get_game_and_player("non-existent-game", "any-player") == (None, None)
@@ -0,0 +1,126 @@
+"""Tests for game session broadcasting."""
+
+import asyncio
+
+import orjson
+
+
+class FakeWebSocket:
+    """Minimal stand-in for a WebSocket that records sent messages."""
+
+    def __init__(self, fail: bool = False, delay: float = 0.0):
+        self.fail = fail
+        self.delay = delay
+        self.sent: list[str] = []
+
+    async def send_text(self, message: str) -> None:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("connection closed")
+        self.sent.append(message)
+
+
+class TestBroadcastState:
+    """Tests for GameSession.broadcast_state."""
+
+    async def test_sends_personalized_state_to_each_player(self, game_with_players):
+        """Test that every connected player receives their own state."""
+        game, players = game_with_players
+        sockets = {player.id: FakeWebSocket() for player in players}
+        game.connections.update(sockets)
+
+        await game.broadcast_state()
+
+        for player_id, websocket in sockets.items():
+            assert len(websocket.sent) == 1
+            message = orjson.loads(websocket.sent[0])
+            assert message["type"] == "state_update"
+            assert message["data"]["your_id"] == player_id
+
+    async def test_failed_socket_is_removed_without_blocking_others(self, game_with_players):
+        """Test that a failing socket is dropped while the rest still receive state."""
+        game, players = game_with_players
+        broken = FakeWebSocket(fail=True, delay=0.01)
+        healthy = FakeWebSocket()
+        game.connections[players[0].id] = broken
+        game.connections[players[1].id] = healthy
+
+        await game.broadcast_state()
+
+        assert players[0].id not in game.connections
+        assert game.connections[players[1].id] is healthy
+        assert len(healthy.sent) == 1
+
+    async def test_reconnected_socket_is_kept(self, game_with_players):
+        """Test that a socket replaced mid-broadcast is not removed."""
+        game, players = game_with_players
+        player_id = players[0].id
+        replacement = FakeWebSocket()
+
+        class ReconnectingWebSocket(FakeWebSocket):
+            async def send_text(self, message: str) -> None:
+                game.connections[player_id] = replacement
+                raise RuntimeError("connection closed")
+
+        game.connections[player_id] = ReconnectingWebSocket()
+
+        await game.broadcast_state()
+
+        assert game.connections[player_id] is replacement
+
+
+class TestScheduleBroadcast:
+    """Tests for GameSession.schedule_broadcast."""
+
+    async def test_burst_of_updates_is_coalesced(self, game_with_players):
+        """Test that several scheduled broadcasts in one window send once."""
+        game, players = game_with_players
+        websocket = FakeWebSocket()
+        game.connections[players[0].id] = websocket
+
+        game.schedule_broadcast()
+        pending = game._broadcast_task
+        game.schedule_broadcast()
+        game.schedule_broadcast()
+        assert pending is not None
+        assert game._broadcast_task is pending
+
+        await pending
+
+        assert len(websocket.sent) == 1
+        assert game._broadcast_task is None
+
+    async def test_coalesced_broadcast_sends_latest_state(self, game_session):
+        """Test that players added during the window are included."""
+        host = game_session.add_player("Host")
+        websocket = FakeWebSocket()
+        game_session.connections[host.id] = websocket
+
+        game_session.schedule_broadcast()
+        pending = game_session._broadcast_task
+        game_session.add_player("Late")
+        assert pending is not None
+
+        await pending
+
+        message = orjson.loads(websocket.sent[0])
+        assert message["data"]["player_count"] == 2
+
+    async def test_update_after_window_schedules_new_broadcast(self, game_with_players):
+        """Test that a broadcast can be scheduled again once the last one ran."""
+        game, players = game_with_players
+        websocket = FakeWebSocket()
+        game.connections[players[0].id] = websocket
+
+        game.schedule_broadcast()
+        first = game._broadcast_task
+        assert first is not None
+        await first
+
+        game.schedule_broadcast()
+        second = game._broadcast_task
+        assert second is not None and second is not first
+        await second
+
+        assert len(websocket.sent) == 2
@@ -0,0 +1,43 @@
+"""Tests for the opt-in profiling middleware."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+pytest.importorskip("pyinstrument")
+
+from middleware.profiler import ProfilerMiddleware  # noqa: E402
+
+
+@pytest.fixture
+def profiled_client():
+    """Create a client for a minimal app wrapped in ProfilerMiddleware."""
+    app = FastAPI()
+    app.add_middleware(ProfilerMiddleware)  # type: ignore[arg-type]
+
+    @app.get("/ping")
+    async def ping():
+        return {"status": "pong"}
+
+    return TestClient(app)
+
+
+class TestProfilerMiddleware:
+    """Test profiling middleware behavior."""
+
+    def test_profile_flag_returns_report(self, profiled_client):
+        """Test that ?__profile returns the pyinstrument HTML report."""
+        response = profiled_client.get("/ping?__profile=1")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/html")
+        assert "pyinstrument" in response.text
+        assert "pong" not in response.text
+
+    def test_without_flag_response_is_unchanged(self, profiled_client):
+        """Test that requests without the flag pass straight through."""
+        response = profiled_client.get("/ping")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == {"status": "pong"}
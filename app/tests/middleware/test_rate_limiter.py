@@ -6,6 +6,7 @@ import pytest
 from fastapi.testclient import TestClient
 
 from app import app
+from middleware.rate_limiter import TokenBucket
 
 
 @pytest.fixture(autouse=True)
@@ -13,9 +14,11 @@ def reset_rate_limiter():
     """Reset rate limiter state before each test."""
     # Clear rate limiter requests between tests
     from middleware.rate_limiter import _rate_limiter
+    from routes.gameplay import _timer_limiter
 
     _rate_limiter.requests.clear()
     _rate_limiter.last_cleanup = time.time()
+    _timer_limiter.buckets.clear()
     yield
 
 
@@ -101,3 +104,49 @@ class TestRateLimiter:
         # Should be able to make requests again
         response = client.get("/health")
         assert response.status_code == 200
+
+
+class TestTokenBucket:
+    """Test per-key token bucket limiting."""
+
+    def test_allows_burst_up_to_capacity(self):
+        """Test that a bucket allows `capacity` requests before denying."""
+        bucket = TokenBucket(rate=1, capacity=5)
+
+        for _ in range(5):
+            assert bucket.is_allowed("key")
+
+        assert not bucket.is_allowed("key")
+
+    def test_keys_are_independent(self):
+        """Test that exhausting one key does not affect another."""
+        bucket = TokenBucket(rate=1, capacity=1)
+
+        assert bucket.is_allowed(("game", "player1"))
+        assert not bucket.is_allowed(("game", "player1"))
+        assert bucket.is_allowed(("game", "player2"))
+
+    def test_bucket_refills_over_time(self):
+        """Test that tokens are replenished at the configured rate."""
+        bucket = TokenBucket(rate=20, capacity=1)
+
+        assert bucket.is_allowed("key")
+        assert not bucket.is_allowed("key")
+
+        time.sleep(0.06)  # 20 tokens/s -> one token every 50ms
+
+        assert bucket.is_allowed("key")
+
+    def test_timer_endpoint_returns_no_content_when_polled_too_fast(self):
+        """Test that the timer endpoint short-circuits once the bucket is empty."""
+        client = TestClient(app)
+
+        # Stay under the 30 req/s per-IP timer limit so only the bucket can refuse
+        statuses = [
+            client.get("/api/games/test-game/timer?player_id=fast-player").status_code
+            for _ in range(29)
+        ]
+
+        assert statuses[:20] == [200] * 20
+        assert 204 in statuses
+        assert 429 not in statuses
@@ -0,0 +1,50 @@
+"""Fixtures for route handler tests."""
+
+import secrets
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import app
+from core.game_manager import game_manager
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limiters():
+    """Reset rate limiter state so endpoint tests never hit 429."""
+    from middleware.rate_limiter import _rate_limiter
+    from routes.gameplay import _timer_limiter
+
+    _rate_limiter.requests.clear()
+    _rate_limiter.last_cleanup = time.time()
+    _timer_limiter.buckets.clear()
+    yield
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Create a test client with a secret key and HTTP-friendly cookies."""
+    # Development mode lets the auth cookie be sent over plain HTTP
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    # TestClient doesn't run lifespan, so set the secret key directly
+    app.state.secret_key = secrets.token_hex(32)
+    return TestClient(app)
+
+
+@pytest.fixture
+def lobby_game(client):
+    """Create a game through the API with 3 joined players (the first is host).
+
+    Returns:
+        Tuple of (game_id, [host_id, player2_id, player3_id])
+    """
+    game_id = client.post("/api/games/create").json()["game_id"]
+    player_ids = [
+        client.post(f"/api/games/{game_id}/join", data={"nickname": f"Player{i + 1}"}).json()[
+            "player_id"
+        ]
+        for i in range(3)
+    ]
+    yield game_id, player_ids
+    game_manager.remove_game(game_id)
@@ -0,0 +1,105 @@
+"""Tests for shared route dependencies."""
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+from app import app
+from core.auth import player_cookie_name
+from core.game_manager import game_manager
+from routes.dependencies import get_base_url
+
+HOST_ONLY_ENDPOINTS = [
+    ("start", {}, "Only host can start the game"),
+    ("set-timer", {"json": {"timer_seconds": 60}}, "Only host can set timer"),
+    ("start-voting", {}, "Only host can start voting"),
+]
+
+
+class TestRequireHost:
+    """Tests for the require_host dependency on host-only endpoints."""
+
+    @pytest.mark.parametrize(("endpoint", "kwargs", "detail"), HOST_ONLY_ENDPOINTS)
+    def test_non_host_is_forbidden(self, client, lobby_game, endpoint, kwargs, detail):
+        """Test that a non-host player gets 403 with the per-action message."""
+        game_id, player_ids = lobby_game
+
+        response = client.post(
+            f"/api/games/{game_id}/{endpoint}?player_id={player_ids[1]}", **kwargs
+        )
+
+        assert response.status_code == 403
+        assert response.json()["detail"] == detail
+
+    @pytest.mark.parametrize(("endpoint", "kwargs", "detail"), HOST_ONLY_ENDPOINTS)
+    def test_unknown_game_returns_404(self, client, lobby_game, endpoint, kwargs, detail):
+        """Test that a valid token for a game that no longer exists gets 404."""
+        game_id, player_ids = lobby_game
+        game_manager.remove_game(game_id)
+
+        response = client.post(
+            f"/api/games/{game_id}/{endpoint}?player_id={player_ids[0]}", **kwargs
+        )
+
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Game not found"
+
+    @pytest.mark.parametrize(("endpoint", "kwargs", "detail"), HOST_ONLY_ENDPOINTS)
+    def test_token_for_other_player_is_forbidden(
+        self, client, lobby_game, endpoint, kwargs, detail
+    ):
+        """Test that presenting another player's token gets 403."""
+        game_id, player_ids = lobby_game
+        host_id, other_id = player_ids[0], player_ids[1]
+        host_token = client.cookies.get(player_cookie_name(host_id))
+
+        # Host's token presented under the other player's cookie name
+        impostor = TestClient(app, cookies={player_cookie_name(other_id): host_token})
+        response = impostor.post(f"/api/games/{game_id}/{endpoint}?player_id={other_id}", **kwargs)
+
+        assert response.status_code == 403
+        assert response.json()["detail"] == "Authentication token does not match player"
+
+    def test_host_is_allowed(self, client, lobby_game):
+        """Test that the host passes the dependency and the action runs."""
+        game_id, player_ids = lobby_game
+
+        response = client.post(f"/api/games/{game_id}/start?player_id={player_ids[0]}")
+
+        assert response.status_code == 200
+        game = game_manager.get_game(game_id)
+        assert game is not None
+        assert game.state.value == "playing"
+
+
+class TestGetBaseUrl:
+    """Tests for the get_base_url dependency."""
+
+    async def test_base_url_is_computed_once_per_request(self):
+        """Test that the base URL is stripped of its slash and kept on request.state."""
+        request = Request(
+            {
+                "type": "http",
+                "scheme": "https",
+                "server": ("dragonseeker.win", 443),
+                "path": "/",
+                "root_path": "",
+                "query_string": b"",
+                "headers": [(b"host", b"dragonseeker.win")],
+            }
+        )
+
+        assert await get_base_url(request) == "https://dragonseeker.win"
+        assert request.state.base_url == "https://dragonseeker.win"
+
+        request.state.base_url = "https://cached.example"
+        assert await get_base_url(request) == "https://cached.example"
+
+    def test_lobby_share_url_uses_base_url(self, client, lobby_game):
+        """Test that the lobby page's share URL is built from the base URL."""
+        game_id, player_ids = lobby_game
+
+        response = client.get(f"/game/{game_id}/lobby?player_id={player_ids[0]}")
+
+        assert response.status_code == 200
+        assert f"http://testserver/game/{game_id}/join" in response.text
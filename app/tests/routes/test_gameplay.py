@@ -0,0 +1,99 @@
+"""Tests for gameplay routes."""
+
+import pytest
+
+from core.game_manager import game_manager
+from core.game_session import GameState
+from routes.gameplay import _timer_cache
+
+
+@pytest.fixture
+def timed_voting_game():
+    """Create a game in voting state with a 90s timer and a fixed clock."""
+    game = game_manager.create_game()
+    for i in range(3):
+        game.add_player(f"Player{i + 1}")
+    game.set_voting_timer(90)
+    game.start_game()
+    game.state = GameState.VOTING
+    game._clock = lambda: 1000.0
+    yield game
+    game_manager.remove_game(game.game_id)
+
+
+class TestTimerEndpoint:
+    """Tests for the polled voting timer partial."""
+
+    def test_countdown_renders_minutes_and_seconds(self, client, timed_voting_game):
+        """Test that the countdown is rendered as m:ss."""
+        game = timed_voting_game
+        player_id = next(iter(game.players))
+        game.voting_started_at = 1000.0 - 25  # 65 seconds left
+
+        response = client.get(f"/api/games/{game.game_id}/timer?player_id={player_id}")
+
+        assert response.status_code == 200
+        assert "Time Remaining" in response.text
+        assert "1:05" in response.text
+        assert "alert-warning" in response.text
+
+    def test_countdown_is_not_cached(self, client, timed_voting_game):
+        """Test that per-second countdown snippets are rendered fresh, not cached."""
+        game = timed_voting_game
+        player_id = next(iter(game.players))
+        game.voting_started_at = 1000.0 - 85  # 5 seconds left
+
+        first = client.get(f"/api/games/{game.game_id}/timer?player_id={player_id}")
+        game._clock = lambda: 1001.0
+        second = client.get(f"/api/games/{game.game_id}/timer?player_id={player_id}")
+
+        assert "0:05" in first.text
+        assert "alert-error" in first.text
+        assert "0:04" in second.text
+        assert not any(key[0] == game.game_id for key in _timer_cache)
+
+    def test_expired_timer_renders_expired_snippet(self, client, timed_voting_game):
+        """Test that an expired timer ends voting and renders the expired snippet."""
+        game = timed_voting_game
+        player_id = next(iter(game.players))
+        game.voting_started_at = 1000.0 - 90
+
+        response = client.get(f"/api/games/{game.game_id}/timer?player_id={player_id}")
+
+        assert response.status_code == 200
+        assert "Voting timer expired!" in response.text
+        assert game.state == GameState.PLAYING
+
+    def test_hidden_timer_outside_voting_is_cached(self, client, timed_voting_game):
+        """Test that the hidden snippet is rendered once and reused."""
+        game = timed_voting_game
+        player_id = next(iter(game.players))
+        game.state = GameState.PLAYING
+
+        first = client.get(f"/api/games/{game.game_id}/timer?player_id={player_id}")
+        second = client.get(f"/api/games/{game.game_id}/timer?player_id={player_id}")
+
+        assert 'style="display: none;"' in first.text
+        assert second.text == first.text
+        assert (game.game_id, player_id, False) in _timer_cache
+
+
+class TestPlayerIdParameter:
+    """Tests for how gameplay routes read the player_id query parameter."""
+
+    @pytest.mark.parametrize(
+        ("method", "path"),
+        [
+            ("GET", "/game/{game_id}/play"),
+            ("POST", "/api/games/{game_id}/vote"),
+            ("POST", "/api/games/{game_id}/guess-word"),
+            ("GET", "/game/{game_id}/results"),
+            ("GET", "/api/games/{game_id}/timer"),
+        ],
+    )
+    def test_missing_player_id_returns_400(self, client, timed_voting_game, method, path):
+        """Test that every gameplay route rejects a missing player_id the same way."""
+        response = client.request(method, path.format(game_id=timed_voting_game.game_id))
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Missing player_id parameter"
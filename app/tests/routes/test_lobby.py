@@ -0,0 +1,83 @@
+"""Tests for lobby routes."""
+
+import pytest
+
+from core.game_manager import game_manager
+
+
+class TestSetTimer:
+    """Tests for the set-timer endpoint and its request model."""
+
+    @pytest.mark.parametrize("timer_seconds", [29, 181])
+    def test_out_of_range_is_rejected(self, client, lobby_game, timer_seconds):
+        """Test that values outside 30-180 fail request validation."""
+        game_id, player_ids = lobby_game
+        game = game_manager.get_game(game_id)
+        assert game is not None
+
+        response = client.post(
+            f"/api/games/{game_id}/set-timer?player_id={player_ids[0]}",
+            json={"timer_seconds": timer_seconds},
+        )
+
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"] == ["body", "timer_seconds"]
+        assert game.voting_timer_seconds is None
+
+    def test_malformed_json_is_rejected(self, client, lobby_game):
+        """Test that a body that isn't valid JSON fails request validation."""
+        game_id, player_ids = lobby_game
+
+        response = client.post(
+            f"/api/games/{game_id}/set-timer?player_id={player_ids[0]}",
+            content=b"not json",
+            headers={"Content-Type": "application/json"},
+        )
+
+        assert response.status_code == 422
+
+    def test_valid_timer_is_accepted(self, client, lobby_game):
+        """Test that an in-range value sets the timer."""
+        game_id, player_ids = lobby_game
+        game = game_manager.get_game(game_id)
+        assert game is not None
+
+        response = client.post(
+            f"/api/games/{game_id}/set-timer?player_id={player_ids[0]}",
+            json={"timer_seconds": 60},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "timer_set", "timer_seconds": 60}
+        assert game.voting_timer_seconds == 60
+
+    def test_null_disables_timer(self, client, lobby_game):
+        """Test that null clears a previously set timer."""
+        game_id, player_ids = lobby_game
+        game = game_manager.get_game(game_id)
+        assert game is not None
+        game.set_voting_timer(60)
+
+        response = client.post(
+            f"/api/games/{game_id}/set-timer?player_id={player_ids[0]}",
+            json={"timer_seconds": None},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "timer_set", "timer_seconds": None}
+        assert game.voting_timer_seconds is None
+
+    def test_cannot_set_timer_after_start(self, client, lobby_game):
+        """Test that a started game still returns 400 from the game's own check."""
+        game_id, player_ids = lobby_game
+        game = game_manager.get_game(game_id)
+        assert game is not None
+        game.start_game()
+
+        response = client.post(
+            f"/api/games/{game_id}/set-timer?player_id={player_ids[0]}",
+            json={"timer_seconds": 60},
+        )
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Can only set timer in lobby"
@@ -0,0 +1,52 @@
+"""Tests for shared template configuration."""
+
+import os
+
+import pytest
+from jinja2 import FileSystemLoader
+
+from routes.templating import template_loader, templates
+
+
+@pytest.fixture
+def template_dir(tmp_path, monkeypatch):
+    """Point the shared template environment at a temporary directory."""
+    monkeypatch.setattr(templates.env, "loader", FileSystemLoader(tmp_path))
+    monkeypatch.setattr(templates.env, "bytecode_cache", None)
+    cache = templates.env.cache
+    assert cache is not None  # Jinja's default LRU template cache
+    cache.clear()
+    yield tmp_path
+    cache.clear()
+
+
+def write_template(path, content: str, mtime: int) -> None:
+    """Write a template file with an explicit mtime so reload checks see the change."""
+    path.write_text(content)
+    os.utime(path, (mtime, mtime))
+
+
+class TestTemplateLoader:
+    """Tests for template_loader."""
+
+    def test_auto_reload_picks_up_edits(self, template_dir, monkeypatch):
+        """Test that edits on disk are rendered when auto_reload is on."""
+        monkeypatch.setattr(templates.env, "auto_reload", True)
+        write_template(template_dir / "page.html", "v1", mtime=1_000_000)
+        get_template = template_loader("page.html")
+        assert get_template().render() == "v1"
+
+        write_template(template_dir / "page.html", "v2", mtime=2_000_000)
+
+        assert get_template().render() == "v2"
+
+    def test_without_auto_reload_template_is_loaded_once(self, template_dir, monkeypatch):
+        """Test that the same compiled template is reused when auto_reload is off."""
+        monkeypatch.setattr(templates.env, "auto_reload", False)
+        write_template(template_dir / "page.html", "v1", mtime=1_000_000)
+        get_template = template_loader("page.html")
+
+        write_template(template_dir / "page.html", "v2", mtime=2_000_000)
+
+        assert get_template() is get_template()
+        assert get_template().render() == "v1"
@@ -59,7 +59,7 @@ class TestCanStartVoting:
         player_ids = list(started_game.players.keys())
         for i, player_id in enumerate(player_ids):
             if i > 0:  # Keep first player alive
-                started_game.players[player_id].is_alive = False
+                started_game.eliminate_player(player_id)
 
         can_start, error = can_start_voting(started_game)
         assert can_start is False
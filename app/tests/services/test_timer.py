@@ -1,7 +1,5 @@
 """Tests for voting timer functionality."""
 
-from datetime import datetime, timedelta
-
 import pytest
 
 
@@ -37,22 +35,41 @@ class TestVotingTimer:
 
     def test_get_voting_time_remaining(self, voting_game):
         """Test timestamp-based timer calculation."""
+        voting_game._clock = lambda: 1000.0
         voting_game.voting_timer_seconds = 60
-        voting_game.voting_started_at = datetime.now()
+        voting_game.voting_started_at = 1000.0
 
-        # Should have close to 60 seconds remaining
-        remaining = voting_game.get_voting_time_remaining()
-        assert remaining is not None
-        assert 59 <= remaining <= 60
+        assert voting_game.get_voting_time_remaining() == 60
+
+        voting_game._clock = lambda: 1015.5
+        assert voting_game.get_voting_time_remaining() == 44
 
     def test_get_voting_time_remaining_expired(self, voting_game):
         """Test that expired timer returns 0."""
+        voting_game._clock = lambda: 1065.0
         voting_game.voting_timer_seconds = 60
-        voting_game.voting_started_at = datetime.now() - timedelta(seconds=65)
+        voting_game.voting_started_at = 1000.0
 
         remaining = voting_game.get_voting_time_remaining()
         assert remaining == 0
 
+    def test_start_voting_timer_uses_clock(self, voting_game):
+        """Test that starting the timer records the injected clock reading."""
+        voting_game._clock = lambda: 1000.0
+        voting_game.voting_timer_seconds = 60
+
+        voting_game.start_voting_timer()
+
+        assert voting_game.voting_started_at == 1000.0
+
+    def test_start_voting_timer_without_timer(self, voting_game):
+        """Test that no start time is recorded when the timer is disabled."""
+        voting_game.voting_timer_seconds = None
+
+        voting_game.start_voting_timer()
+
+        assert voting_game.voting_started_at is None
+
     def test_get_voting_time_remaining_no_timer(self, voting_game):
         """Test that no timer returns None."""
         voting_game.voting_timer_seconds = None
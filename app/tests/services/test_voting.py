@@ -29,7 +29,7 @@ class TestCanVote:
     def test_cannot_vote_when_player_dead(self, voting_game):
         """Test that dead players cannot vote."""
         player_id = list(voting_game.players.keys())[0]
-        voting_game.players[player_id].is_alive = False
+        voting_game.eliminate_player(player_id)
         can, error = can_vote(voting_game, player_id)
         assert can is False
         assert error == "Dead players cannot vote"
@@ -78,7 +78,7 @@ class TestAllVotesSubmitted:
         player_ids = list(voting_game.players.keys())
 
         # Kill one player
-        voting_game.players[player_ids[0]].is_alive = False
+        voting_game.eliminate_player(player_ids[0])
 
         # Remaining 4 players vote
         for i in range(1, 5):
@@ -89,3 +89,48 @@ class TestAllVotesSubmitted:
                 voting_game.votes[player_ids[i]] = player_ids[1]
 
         assert all_votes_submitted(voting_game) is True
+
+
+class TestAliveCount:
+    """Tests for the maintained alive player counter."""
+
+    def test_alive_count_tracks_joins_and_leaves(self, game_with_players):
+        """Test that joining and leaving the lobby updates the count."""
+        game, players = game_with_players
+        assert game.alive_count == 5
+
+        game.remove_player(players[0].id)
+        assert game.alive_count == 4
+
+    def test_alive_count_decrements_on_elimination(self, voting_game):
+        """Test that tallying votes decrements the count for the eliminated player."""
+        player_ids = list(voting_game.players.keys())
+        for voter_id in player_ids:
+            voting_game.submit_vote(voter_id, player_ids[0])
+
+        voting_game.tally_votes()
+
+        assert voting_game.alive_count == 4
+        assert voting_game.alive_count == sum(1 for p in voting_game.players.values() if p.is_alive)
+
+    def test_eliminate_player_decrements_once(self, voting_game):
+        """Test that eliminating a player twice only counts one death."""
+        player_id = next(iter(voting_game.players))
+
+        voting_game.eliminate_player(player_id)
+        voting_game.eliminate_player(player_id)
+
+        assert voting_game.players[player_id].is_alive is False
+        assert voting_game.alive_count == 4
+
+    def test_all_votes_submitted_uses_alive_count(self, voting_game):
+        """Test that vote completion is judged against the maintained counter."""
+        player_ids = list(voting_game.players.keys())
+        for player_id in player_ids[:3]:
+            voting_game.eliminate_player(player_id)
+
+        voting_game.votes[player_ids[3]] = player_ids[4]
+        assert all_votes_submitted(voting_game) is False
+
+        voting_game.votes[player_ids[4]] = player_ids[3]
+        assert all_votes_submitted(voting_game) is True